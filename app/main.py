@@ -1,7 +1,11 @@
-from datetime import datetime
-from typing import Tuple
-
-import altair as alt
+import contextlib
+import os
+import tempfile
+import time
+from datetime import date, datetime
+from typing import Iterable, List, Tuple
+
+import numpy as np
 import pandas as pd
 import streamlit as st
 from datasets import load_dataset
@@ -18,29 +22,163 @@ class GovBRNewsAnalysis:
     """Class to encapsulate the logic for analyzing GovBR News data."""
 
     df: pd.DataFrame
+    counts: pd.DataFrame
+
+    # How long the loaded dataset is reused before fetching it again (6 hours)
+    DATA_TTL = 3600 * 6
+    # Version of the prepare_articles output; bump it whenever its columns change
+    PREPARED_DATA_VERSION = 1
+    # Local copy of the preprocessed dataset, shared across process restarts
+    PREPARED_DATA_PATH = os.path.join(
+        tempfile.gettempdir(), f"govbrnews_prep_v{PREPARED_DATA_VERSION}.parquet"
+    )
+
+    # Static portion of the Vega-Lite spec shared by the line charts
+    LINE_CHART_SPEC = {
+        "$schema": "https://vega.github.io/schema/vega-lite/v5.json",
+        "mark": "line",
+        "width": 700,
+        "height": 400,
+    }
 
     def __init__(self):
         self.granularity_column = "year"
 
     @staticmethod
-    @st.cache_data(ttl=3600 * 6)  # Cache the dataset for 6 hours
-    def load_data() -> pd.DataFrame:
+    @st.cache_resource(ttl=DATA_TTL, max_entries=1)
+    def load_data(data_window: int) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Load the preprocessed dataset and count the articles per day and agency.
+
+        The daily counts are precomputed here so every granularity can be
+        rolled up from this small table instead of grouping the raw articles
+        on each rerun. Both DataFrames are sorted by 'day'.
+
+        The result is cached as a shared resource, so cache hits return the same
+        DataFrames without pickling them. They must be treated as read-only.
+
+        Args:
+            data_window (int): Index of the current DATA_TTL-long time window
+                (see current_data_window). The cache and the local parquet copy
+                are only reused within the window they were loaded in, so the
+                data served is never older than DATA_TTL.
+
+        Returns:
+            Tuple[pd.DataFrame, pd.DataFrame]: Preprocessed dataset with temporal
+            columns and daily article counts by agency.
+        """
+        df = GovBRNewsAnalysis.load_articles(data_window)
+        counts = (
+            df.groupby(["day", "year", "month", "week", "agency"], observed=True)
+            .size()
+            .reset_index(name="Count")
+        )
+        return df, counts
+
+    @staticmethod
+    def current_data_window() -> int:
+        """
+        Index of the current DATA_TTL-long time window, used as load_data's key.
+
+        Returns:
+            int: Number of whole DATA_TTL periods since the epoch.
+        """
+        return int(time.time() // GovBRNewsAnalysis.DATA_TTL)
+
+    @staticmethod
+    def load_articles(data_window: int) -> pd.DataFrame:
+        """
+        Load the preprocessed dataset from its local parquet copy, if it was
+        written within the current time window, or prepare it from Hugging Face
+        and refresh the copy.
+
+        Unlike the in-memory cache, the copy survives process restarts.
+
+        Args:
+            data_window (int): Index of the current DATA_TTL-long time window.
+
+        Returns:
+            pd.DataFrame: Preprocessed dataset with temporal columns.
+        """
+        path = GovBRNewsAnalysis.PREPARED_DATA_PATH
+        window_start = data_window * GovBRNewsAnalysis.DATA_TTL
+        try:
+            if os.path.getmtime(path) >= window_start:
+                # Parquet only restores categoricals of strings (e.g., agency)
+                return pd.read_parquet(path).astype(
+                    {"month": "category", "week": "category"}
+                )
+        except Exception:
+            pass  # No usable local copy (missing, unreadable or unexpected columns)
+
+        df = GovBRNewsAnalysis.prepare_articles()
+        # Write to a temporary file first, so readers never see a partial copy
+        partial_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            df.to_parquet(partial_path, compression="zstd")
+            os.replace(partial_path, path)
+        except Exception:
+            # The local copy is only a shortcut; keep serving from memory
+            with contextlib.suppress(OSError):
+                os.remove(partial_path)
+        return df
+
+    @staticmethod
+    def prepare_articles() -> pd.DataFrame:
         """
         Load the dataset from Hugging Face and prepare necessary columns.
 
+        The 'day' column holds the number of days since 1970-01-01 (int32), and
+        the rows are sorted by it. 'month' and 'week' are categoricals whose
+        categories are the bucket start dates.
+
         Returns:
             pd.DataFrame: Preprocessed dataset with temporal columns.
         """
         dataset = load_dataset("nitaibezerra/govbrnews-reduced", split="train")
+        # Only these columns are used, so the others are never converted
+        dataset = dataset.select_columns(["published_at", "agency", "title", "url"])
         df = pd.DataFrame(dataset)
-        df["published_at"] = pd.to_datetime(df["published_at"])
+        # ISO 8601 timestamps: skip per-value format inference, reuse repeated values
+        df["published_at"] = pd.to_datetime(
+            df["published_at"], format="ISO8601", cache=True
+        )
         df = df.dropna(subset=["published_at"])
-        df["year"] = df["published_at"].dt.year
-        df["month"] = df["published_at"].dt.to_period("M").dt.to_timestamp()
-        df["week"] = df["published_at"].dt.to_period("W").dt.to_timestamp()
-        df["day"] = df["published_at"].dt.date
+        df["agency"] = df["agency"].astype("category")
+        # Buckets follow the local wall time of each timestamp
+        local_time = df["published_at"].dt.tz_localize(None)
+        df["year"] = df["published_at"].dt.year.astype("int16")
+        # Days since the epoch, so day filters compare plain integers
+        df["day"] = local_time.values.astype("datetime64[D]").astype("int32")
+        # Month and week (starting on Monday; 1970-01-01 was a Thursday) buckets
+        # are stored as small integer codes into their sorted start dates
+        df["month"] = GovBRNewsAnalysis._to_buckets(
+            local_time.values.astype("datetime64[M]")
+        )
+        df["week"] = GovBRNewsAnalysis._to_buckets(
+            (df["day"].values - (df["day"].values + 3) % 7).astype("datetime64[D]")
+        )
+        # Keep rows ordered by day, so day ranges can be sliced by binary search
+        df = df.sort_values("day", kind="stable", ignore_index=True)
         return df
 
+    @staticmethod
+    def _to_buckets(starts: np.ndarray) -> pd.Categorical:
+        """
+        Encode the start date of each row's temporal bucket as a categorical,
+        i.e., integer codes into the sorted unique bucket start dates.
+
+        Args:
+            starts (np.ndarray): datetime64 start date of each row's bucket.
+
+        Returns:
+            pd.Categorical: Bucket start dates, coded by their position.
+        """
+        buckets, codes = np.unique(starts, return_inverse=True)
+        return pd.Categorical.from_codes(
+            codes, categories=pd.DatetimeIndex(buckets.astype("datetime64[ns]"))
+        )
+
     def select_agencies(self) -> list:
         """
         Provide a UI to select the agencies to be considered,
@@ -49,7 +187,8 @@ class GovBRNewsAnalysis:
         Returns:
             list: List of selected agencies.
         """
-        agencies = sorted(self.df["agency"].unique().tolist())
+        # The categories are the sorted agencies, computed once in load_data
+        agencies: List[str] = self.df["agency"].cat.categories.tolist()
 
         # Use Streamlit's session state to track the selected agencies
         if "selected_agencies" not in st.session_state:
@@ -87,70 +226,253 @@ class GovBRNewsAnalysis:
         self.granularity_column = granularity.lower()
         return granularity
 
-    def get_min_max_values(self) -> Tuple[pd.Timestamp, pd.Timestamp]:
+    def get_min_max_values(self) -> Tuple[date, date]:
         """
-        Retrieve the minimum and maximum values for the temporal range based on 'day'.
+        Retrieve the minimum and maximum values for the temporal range based on 'day',
+        for the selected agencies.
 
         Returns:
-            Tuple[pd.Timestamp, pd.Timestamp]: Minimum and maximum values.
+            Tuple[date, date]: Minimum and maximum values.
         """
-        min_value = self.df["day"].min()
-        max_value = self.df["day"].max()
+        # The daily counts are sorted by day: the extremes are the first and last rows
+        days = self.counts["day"].values
+        min_value = np.datetime64(int(days[0]), "D").item()
+        max_value = np.datetime64(int(days[-1]), "D").item()
         return min_value, max_value
 
-    def filter_data(
-        self, selected_range: Tuple[pd.Timestamp, pd.Timestamp]
+    @staticmethod
+    def _agency_mask(agency: pd.Series, agencies: Iterable) -> np.ndarray:
+        """
+        Build a boolean mask of the rows whose agency is in `agencies`.
+
+        Instead of comparing strings, a lookup table with one flag per category
+        is built and gathered by the categorical codes of `agency`.
+
+        Args:
+            agency (pd.Series): Categorical agency column.
+            agencies (Iterable): Agencies to keep.
+
+        Returns:
+            np.ndarray: Boolean mask aligned with `agency`.
+        """
+        categories = agency.cat.categories
+        # One extra (always False) slot, picked up by the -1 code of missing values
+        lookup = np.zeros(len(categories) + 1, dtype=bool)
+        codes = categories.get_indexer(agencies)
+        lookup[codes[codes >= 0]] = True
+        return lookup[agency.cat.codes.values]
+
+    @staticmethod
+    def _filter_by_day(
+        data: pd.DataFrame, selected_range: Tuple[date, date]
     ) -> pd.DataFrame:
         """
-        Filter the dataset based on the selected day range.
+        Keep only the rows of `data` whose 'day' falls within the selected range.
+
+        Since `data` is sorted by day, the range is located with two binary
+        searches and returned as a positional slice, without building a mask.
 
         Args:
-            selected_range (Tuple[pd.Timestamp, pd.Timestamp]): Selected day range for filtering.
+            data (pd.DataFrame): Dataset sorted by an integer 'day' column.
+            selected_range (Tuple[date, date]): Selected day range for filtering.
 
         Returns:
             pd.DataFrame: Filtered dataset.
         """
-        return self.df[
-            (self.df["day"] >= selected_range[0])
-            & (self.df["day"] <= selected_range[1])
-        ]
+        start, end = (np.datetime64(d, "D").astype("int32") for d in selected_range)
+        days = data["day"].values
+        lo = np.searchsorted(days, start, side="left")
+        hi = np.searchsorted(days, end, side="right")
+        return data.iloc[lo:hi]
 
-    def aggregate_data(self, filtered_df: pd.DataFrame) -> pd.DataFrame:
+    def filter_data(self, selected_range: Tuple[date, date]) -> pd.DataFrame:
         """
-        Aggregate the filtered dataset by the selected granularity.
+        Filter the dataset based on the selected day range.
+
+        The agency selection is not applied here: each view masks only the rows
+        and columns it needs (see display_filtered_articles), instead of copying
+        every column of the dataset on each rerun.
 
         Args:
-            filtered_df (pd.DataFrame): Filtered dataset.
+            selected_range (Tuple[date, date]): Selected day range for filtering.
+
+        Returns:
+            pd.DataFrame: Articles within the day range, from all agencies.
+        """
+        return self._filter_by_day(self.df, selected_range)
+
+    def filter_counts(self, selected_range: Tuple[date, date]) -> pd.DataFrame:
+        """
+        Filter the precomputed daily counts based on the selected day range.
+
+        Args:
+            selected_range (Tuple[date, date]): Selected day range for filtering.
+
+        Returns:
+            pd.DataFrame: Filtered daily counts by agency.
+        """
+        return self._filter_by_day(self.counts, selected_range)
+
+    def aggregate_data(self, filtered_counts: pd.DataFrame) -> pd.DataFrame:
+        """
+        Aggregate the filtered daily counts by the selected granularity.
+
+        The daily counts are sorted by day, so the integer keys (or categorical
+        codes) of every granularity are non-decreasing and each bucket is a run
+        of equal keys. The runs are summed in a single pass, without hashing or
+        sorting the keys.
+
+        Args:
+            filtered_counts (pd.DataFrame): Filtered daily counts by agency, sorted by day.
 
         Returns:
             pd.DataFrame: Aggregated dataset with counts.
         """
-        news_by_granularity = (
-            filtered_df[self.granularity_column]
-            .value_counts()
-            .sort_index()
-            .reset_index()
+        column = filtered_counts[self.granularity_column]
+        is_categorical = isinstance(column.dtype, pd.CategoricalDtype)
+        keys = column.cat.codes.values if is_categorical else column.values
+
+        # Each run starts where the key differs from the previous one
+        run_starts = np.empty(len(keys), dtype=bool)
+        run_starts[:1] = True
+        np.not_equal(keys[1:], keys[:-1], out=run_starts[1:])
+        starts = np.flatnonzero(run_starts)
+
+        buckets = keys[starts]
+        if is_categorical:
+            buckets = pd.Categorical.from_codes(buckets, dtype=column.dtype)
+        return pd.DataFrame(
+            {
+                self.granularity_column.capitalize(): buckets,
+                "Count": np.add.reduceat(filtered_counts["Count"].values, starts),
+            }
         )
-        news_by_granularity.columns = [self.granularity_column.capitalize(), "Count"]
-        return news_by_granularity
 
-    def aggregate_by_agency(self, filtered_df: pd.DataFrame) -> pd.DataFrame:
+    def aggregate_by_agency(self, filtered_counts: pd.DataFrame) -> pd.DataFrame:
         """
-        Aggregate the filtered dataset by agency and granularity.
+        Aggregate the filtered daily counts by agency and granularity.
 
         Args:
-            filtered_df (pd.DataFrame): Filtered dataset.
+            filtered_counts (pd.DataFrame): Filtered daily counts by agency.
 
         Returns:
             pd.DataFrame: Aggregated dataset with counts by agency.
         """
+        # Only the temporal order matters for plotting, so sort by that key alone
         grouped = (
-            filtered_df.groupby([self.granularity_column, "agency"])
-            .size()
-            .reset_index(name="Count")
+            filtered_counts.groupby(
+                [self.granularity_column, "agency"], observed=True, sort=False
+            )["Count"]
+            .sum()
+            .reset_index()
         )
         grouped.columns = [self.granularity_column.capitalize(), "Agency", "Count"]
-        return grouped
+        return grouped.sort_values(
+            self.granularity_column.capitalize(), kind="stable", ignore_index=True
+        )
+
+    def rank_agencies(self, filtered_counts: pd.DataFrame) -> pd.Series:
+        """
+        Rank the agencies by their number of articles in the filtered daily counts.
+
+        Args:
+            filtered_counts (pd.DataFrame): Filtered daily counts by agency.
+
+        Returns:
+            pd.Series: Article counts by agency, in descending order (ties by name).
+        """
+        return (
+            filtered_counts.groupby("agency", observed=True)["Count"]
+            .sum()
+            .sort_values(ascending=False, kind="stable")
+        )
+
+    @classmethod
+    def _format_bucket(cls, series: pd.Series, granularity: str) -> list:
+        """
+        Format temporal buckets as x-axis labels.
+
+        Labels are built from the integer date components instead of
+        `dt.strftime`, which formats each value in a Python-level loop.
+        Categorical buckets are formatted once per category and looked up
+        by code.
+
+        Args:
+            series (pd.Series): Bucket values for the given granularity.
+            granularity (str): Temporal granularity of the buckets.
+
+        Returns:
+            list: Formatted labels, in the same order as `series`.
+        """
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            categories = pd.Series(series.cat.categories)
+            labels = np.array(cls._format_bucket(categories, granularity), dtype=object)
+            return labels[series.cat.codes.values].tolist()
+        granularity = granularity.lower()
+        if granularity == "month":
+            years, months = series.dt.year.values, series.dt.month.values
+            return [f"{y}-{m:02d}" for y, m in zip(years, months)]
+        if granularity == "week":
+            iso = series.dt.isocalendar()
+            return [
+                f"{y}-W{w:02d}" for y, w in zip(iso["year"].values, iso["week"].values)
+            ]
+        if granularity == "day":
+            return series.values.astype("datetime64[D]").astype(str).tolist()
+        return series.tolist()
+
+    @staticmethod
+    def _format_dates(days: np.ndarray) -> list:
+        """
+        Format day ordinals as DD/MM/YYYY.
+
+        The date components are extracted with numpy datetime64 arithmetic on
+        the whole array, instead of calling `dt.strftime` per value.
+
+        Args:
+            days (np.ndarray): Days since 1970-01-01.
+
+        Returns:
+            list: Formatted dates, in the same order as `days`.
+        """
+        dates = days.astype("datetime64[D]")
+        month_starts = dates.astype("datetime64[M]")
+        years = dates.astype("datetime64[Y]").astype(int) + 1970
+        months = month_starts.astype(int) % 12 + 1
+        days_of_month = (dates - month_starts).astype(int) + 1
+        return [f"{d:02d}/{m:02d}/{y}" for y, m, d in zip(years, months, days_of_month)]
+
+    def _line_chart_spec(self, granularity: str, title: str, **encoding) -> dict:
+        """
+        Build the Vega-Lite spec of a line chart with the number of articles
+        over the selected granularity.
+
+        The spec is written directly instead of going through Altair, which
+        validates the whole chart against the Vega-Lite schema on every rerun.
+        It holds no data (the DataFrame is passed separately and sent as
+        Arrow), so building it is cheaper than hashing the data to memoize it.
+
+        Args:
+            granularity (str): Temporal granularity for the x-axis.
+            title (str): Chart title.
+            **encoding: Additional encoding channels (e.g., color, tooltip).
+
+        Returns:
+            dict: Vega-Lite spec, without data.
+        """
+        return {
+            **self.LINE_CHART_SPEC,
+            "title": title,
+            "encoding": {
+                "x": {"field": granularity, "type": "ordinal", "title": granularity},
+                "y": {
+                    "field": "Count",
+                    "type": "quantitative",
+                    "title": "Número de Artigos",
+                },
+                **encoding,
+            },
+        }
 
     def plot_total(self, data: pd.DataFrame, granularity: str) -> None:
         """
@@ -161,33 +483,28 @@ class GovBRNewsAnalysis:
             granularity (str): Temporal granularity for the plot.
         """
         # Format x-axis labels based on granularity
-        if granularity.lower() == "month":
-            data[granularity] = data[granularity].dt.strftime("%Y-%m")
-        elif granularity.lower() == "week":
-            data[granularity] = data[granularity].dt.strftime("%G-W%V")
-        elif granularity.lower() == "day":
-            data[granularity] = pd.to_datetime(data[granularity]).dt.strftime(
-                "%Y-%m-%d"
-            )
+        data = data.assign(
+            **{granularity: self._format_bucket(data[granularity], granularity)}
+        )
 
-        chart = (
-            alt.Chart(data)
-            .mark_line()
-            .encode(
-                x=alt.X(f"{granularity}:O", title=granularity),
-                y=alt.Y("Count:Q", title="Número de Artigos"),
-                tooltip=[granularity, "Count"],
-            )
-            .properties(
-                title=f"Número de Artigos de Notícias por {granularity}",
-                width=700,
-                height=400,
-            )
+        # The data is already aggregated in pandas, so the chart only carries one
+        # row per bucket and is passed to Streamlit as a DataFrame (Arrow).
+        spec = self._line_chart_spec(
+            granularity,
+            title=f"Número de Artigos de Notícias por {granularity}",
+            tooltip=[
+                {"field": granularity, "type": "ordinal"},
+                {"field": "Count", "type": "quantitative"},
+            ],
         )
-        st.altair_chart(chart, use_container_width=True)
+        st.vega_lite_chart(data, spec, use_container_width=True)
 
     def plot_by_agency(
-        self, data: pd.DataFrame, granularity: str, rank_range: Tuple[int, int]
+        self,
+        data: pd.DataFrame,
+        granularity: str,
+        agency_totals: pd.Series,
+        rank_range: Tuple[int, int],
     ) -> None:
         """
         Plot the aggregated data as a line chart with one line per agency,
@@ -196,47 +513,35 @@ class GovBRNewsAnalysis:
         Args:
             data (pd.DataFrame): Aggregated data to plot.
             granularity (str): Temporal granularity for the plot.
+            agency_totals (pd.Series): Article counts by agency, ranked (see rank_agencies).
             rank_range (Tuple[int, int]): The range of ranks to display (e.g., (1, 10)).
         """
         # Determine the agencies within the selected rank range
-        top_agencies = (
-            data.groupby("Agency")["Count"]
-            .sum()
-            .nlargest(rank_range[1])  # Get up to the highest rank
-            .iloc[rank_range[0] - 1 : rank_range[1]]  # Select the specific range
-            .index
-        )
-        data = data[data["Agency"].isin(top_agencies)]
+        top_agencies = agency_totals.index[rank_range[0] - 1 : rank_range[1]]
+        data = data[self._agency_mask(data["Agency"], top_agencies)]
 
         # Format x-axis labels based on granularity
-        if granularity.lower() == "month":
-            data[granularity] = data[granularity].dt.strftime("%Y-%m")
-        elif granularity.lower() == "week":
-            data[granularity] = data[granularity].dt.strftime("%G-W%V")
-        elif granularity.lower() == "day":
-            data[granularity] = pd.to_datetime(data[granularity]).dt.strftime(
-                "%Y-%m-%d"
-            )
+        data = data.assign(
+            **{granularity: self._format_bucket(data[granularity], granularity)}
+        )
 
-        chart = (
-            alt.Chart(data)
-            .mark_line()
-            .encode(
-                x=alt.X(f"{granularity}:O", title=granularity),
-                y=alt.Y("Count:Q", title="Número de Artigos"),
-                color="Agency:N",
-                tooltip=[granularity, "Agency", "Count"],
-            )
-            .properties(
-                title=f"Número de Artigos por Agência (Classificação {rank_range[0]} a {rank_range[1]})",
-                width=700,
-                height=400,
-            )
+        spec = self._line_chart_spec(
+            granularity,
+            title=f"Número de Artigos por Agência (Classificação {rank_range[0]} a {rank_range[1]})",
+            color={"field": "Agency", "type": "nominal"},
+            tooltip=[
+                {"field": granularity, "type": "ordinal"},
+                {"field": "Agency", "type": "nominal"},
+                {"field": "Count", "type": "quantitative"},
+            ],
         )
-        st.altair_chart(chart, use_container_width=True)
+        st.vega_lite_chart(data, spec, use_container_width=True)
 
     def display_filtered_articles(
-        self, filtered_df: pd.DataFrame, rank_range: Tuple[int, int]
+        self,
+        filtered_df: pd.DataFrame,
+        agency_totals: pd.Series,
+        rank_range: Tuple[int, int],
     ) -> None:
         """
         Display a table of articles ordered by published_at (desc) and agency (asc),
@@ -244,28 +549,26 @@ class GovBRNewsAnalysis:
 
         Args:
             filtered_df (pd.DataFrame): Filtered dataset.
+            agency_totals (pd.Series): Article counts by agency, ranked (see rank_agencies).
             rank_range (Tuple[int, int]): The range of ranks to display (e.g., (1, 10)).
         """
         # Determine the agencies within the selected rank range
-        top_agencies = (
-            filtered_df.groupby("agency")["title"]
-            .count()
-            .nlargest(rank_range[1])  # Get up to the highest rank
-            .iloc[rank_range[0] - 1 : rank_range[1]]  # Select the specific range
-            .index
-        )
+        top_agencies = agency_totals.index[rank_range[0] - 1 : rank_range[1]]
 
-        # Filter the dataset for articles from the selected agencies
-        filtered_articles = filtered_df[filtered_df["agency"].isin(top_agencies)]
+        # Take only the articles from those agencies, and only the columns used below
+        filtered_articles = filtered_df.loc[
+            self._agency_mask(filtered_df["agency"], top_agencies),
+            ["published_at", "agency", "day", "title", "url"],
+        ]
 
         # Sort the filtered dataset
         sorted_articles = filtered_articles.sort_values(
             by=["published_at", "agency"], ascending=[False, True]
         )
 
-        # Format `published_at` to display only DD/MM/YYYY
-        sorted_articles["published_date"] = sorted_articles["published_at"].dt.strftime(
-            "%d/%m/%Y"
+        # Format `published_at` to display only DD/MM/YYYY (from its 'day')
+        sorted_articles["published_date"] = self._format_dates(
+            sorted_articles["day"].values
         )
 
         # Select the desired columns
@@ -277,6 +580,51 @@ class GovBRNewsAnalysis:
         st.write("### Artigos Filtrados")
         st.dataframe(displayed_columns, use_container_width=True)
 
+    @st.fragment
+    def display_agency_ranking(
+        self,
+        filtered_df: pd.DataFrame,
+        aggregated_by_agency: pd.DataFrame,
+        granularity: str,
+        agency_totals: pd.Series,
+    ) -> None:
+        """
+        Display the rank range selector, the chart by agency and the table of
+        articles from the agencies within the selected rank range.
+
+        This section is a fragment: moving the rank slider reruns only it,
+        without reloading, filtering and aggregating the data again.
+
+        Args:
+            filtered_df (pd.DataFrame): Filtered dataset.
+            aggregated_by_agency (pd.DataFrame): Aggregated data by agency.
+            granularity (str): Temporal granularity for the plot.
+            agency_totals (pd.Series): Article counts by agency, ranked (see rank_agencies).
+        """
+        # Dynamically calculate max_value for the rank slider based on the number of agencies
+        max_agencies = len(agency_totals)
+
+        # Add range slider for selecting the rank range
+        rank_range = st.slider(
+            "Selecione o intervalo de agências para exibir por classificação",
+            min_value=1,
+            max_value=max_agencies,
+            value=(
+                1,
+                min(10, max_agencies),
+            ),
+            step=1,
+            help="Ajuste para mostrar um intervalo específico de agências por classificação.",
+        )
+
+        # Plot the data by agency with rank range
+        self.plot_by_agency(
+            aggregated_by_agency, granularity, agency_totals, rank_range
+        )
+
+        # Display the filtered articles table
+        self.display_filtered_articles(filtered_df, agency_totals, rank_range)
+
     def run(self) -> None:
         """Run the Streamlit application."""
         st.title("Análise de Notícias GovBR")
@@ -310,13 +658,15 @@ class GovBRNewsAnalysis:
             """
         )
         # Load the dataset
-        self.df = self.load_data()
+        self.df, self.counts = self.load_data(self.current_data_window())
 
         # Select agencies
         selected_agencies = self.select_agencies()
 
-        # Filter the data by selected agencies
-        self.df = self.df[self.df["agency"].isin(selected_agencies)]
+        # Filter the daily counts by selected agencies
+        self.counts = self.counts[
+            self._agency_mask(self.counts["agency"], selected_agencies)
+        ]
 
         # Select granularity for aggregation
         granularity = self.select_granularity()
@@ -338,38 +688,23 @@ class GovBRNewsAnalysis:
 
         # Filter and process data
         filtered_df = self.filter_data(selected_range)
-        aggregated_data = self.aggregate_data(filtered_df)
-        aggregated_by_agency = self.aggregate_by_agency(filtered_df)
+        filtered_counts = self.filter_counts(selected_range)
+        aggregated_data = self.aggregate_data(filtered_counts)
+        aggregated_by_agency = self.aggregate_by_agency(filtered_counts)
+        agency_totals = self.rank_agencies(filtered_counts)
 
         # Display total number of news articles
-        total_articles = filtered_df.shape[0]
+        total_articles = int(filtered_counts["Count"].sum())
         st.metric(label="Total de Artigos de Notícias", value=total_articles)
 
         # Plot the data
         self.plot_total(aggregated_data, granularity)
 
-        # Dynamically calculate max_value for the rank slider based on the number of agencies
-        max_agencies = aggregated_by_agency["Agency"].nunique()
-
-        # Add range slider for selecting the rank range
-        rank_range = st.slider(
-            "Selecione o intervalo de agências para exibir por classificação",
-            min_value=1,
-            max_value=max_agencies,
-            value=(
-                1,
-                min(10, max_agencies),
-            ),
-            step=1,
-            help="Ajuste para mostrar um intervalo específico de agências por classificação.",
+        # Rank slider, chart by agency and articles table (rerun on their own)
+        self.display_agency_ranking(
+            filtered_df, aggregated_by_agency, granularity, agency_totals
         )
 
-        # Plot the data by agency with rank range
-        self.plot_by_agency(aggregated_by_agency, granularity, rank_range)
-
-        # Display the filtered articles table
-        self.display_filtered_articles(filtered_df, rank_range)
-
 
 # Run the application
 if __name__ == "__main__":
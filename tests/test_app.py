@@ -17,4 +17,103 @@ def test_app_version():
     assert isinstance(app.__version__, str)
 
 
+def test_format_bucket_labels():
+    """Test that temporal buckets are formatted like strftime would"""
+    import pandas as pd
+    from app.main import GovBRNewsAnalysis
+
+    buckets = pd.Series(pd.to_datetime(["2020-12-28", "2021-01-04", "2021-03-09"]))
+    for granularity, fmt in [
+        ("Month", "%Y-%m"),
+        ("Week", "%G-W%V"),
+        ("Day", "%Y-%m-%d"),
+    ]:
+        labels = GovBRNewsAnalysis._format_bucket(buckets, granularity)
+        assert labels == buckets.dt.strftime(fmt).tolist()
+        categorical = GovBRNewsAnalysis._format_bucket(
+            buckets.astype("category"), granularity
+        )
+        assert categorical == labels
+
+
+def test_format_dates():
+    """Test that day ordinals are formatted as DD/MM/YYYY"""
+    import pandas as pd
+    from app.main import GovBRNewsAnalysis
+
+    dates = pd.to_datetime(["1969-12-31", "2000-02-29", "2024-11-05"])
+    days = dates.values.astype("datetime64[D]").astype("int32")
+    labels = GovBRNewsAnalysis._format_dates(days)
+    assert labels == dates.strftime("%d/%m/%Y").tolist()
+
+
+def test_agency_mask():
+    """Test the agency mask, including unknown agencies and missing values"""
+    import pandas as pd
+    from app.main import GovBRNewsAnalysis
+
+    agency = pd.Series(["MEC", "MS", None, "MEC", "MJ"], dtype="category")
+    mask = GovBRNewsAnalysis._agency_mask(agency, ["MEC", "MJ", "Unknown"])
+    assert mask.tolist() == [True, False, False, True, True]
+
+
+def test_filter_by_day_is_inclusive():
+    """Test that the day range filter keeps both ends of the range"""
+    from datetime import date
+
+    import pandas as pd
+    from app.main import GovBRNewsAnalysis
+
+    days = pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-02", "2024-01-04"])
+    data = pd.DataFrame(
+        {"day": days.values.astype("datetime64[D]").astype("int32"), "n": range(4)}
+    )
+    selected_range = (date(2024, 1, 2), date(2024, 1, 4))
+    filtered = GovBRNewsAnalysis._filter_by_day(data, selected_range)
+    assert filtered["n"].tolist() == [1, 2, 3]
+    assert GovBRNewsAnalysis._filter_by_day(data, (date(2023, 1, 1),) * 2).empty
+
+
+def test_aggregate_data_matches_groupby():
+    """Test that summing runs of day-sorted keys matches a groupby sum"""
+    import pandas as pd
+    from app.main import GovBRNewsAnalysis
+
+    # Daily counts as load_data builds them: sorted by day, with month buckets
+    # encoded by _to_buckets (categories sorted by their start date)
+    dates = pd.to_datetime(
+        ["2024-01-30", "2024-01-30", "2024-01-31", "2024-02-01", "2024-02-01"]
+    ).values
+    counts = pd.DataFrame(
+        {
+            "day": dates.astype("datetime64[D]").astype("int32"),
+            "month": GovBRNewsAnalysis._to_buckets(dates.astype("datetime64[M]")),
+            "Count": [3, 1, 2, 5, 1],
+        }
+    )
+    # Precondition of aggregate_data: keys never decrease
+    assert counts["month"].cat.codes.is_monotonic_increasing
+
+    app = GovBRNewsAnalysis()
+    for granularity in ["day", "month"]:
+        app.granularity_column = granularity
+        aggregated = app.aggregate_data(counts)
+        expected = counts.groupby(granularity, observed=True)["Count"].sum()
+        assert aggregated[granularity.capitalize()].tolist() == expected.index.tolist()
+        assert aggregated["Count"].tolist() == expected.tolist()
+        assert app.aggregate_data(counts.iloc[:0]).empty
+
+
+def test_aggregate_data_requires_day_sorted_input():
+    """Test that unsorted input splits a bucket, so the input must be day-sorted"""
+    import pandas as pd
+    from app.main import GovBRNewsAnalysis
+
+    counts = pd.DataFrame({"day": [1, 2, 1], "Count": [1, 1, 1]})
+    app = GovBRNewsAnalysis()
+    app.granularity_column = "day"
+    assert app.aggregate_data(counts)["Day"].tolist() == [1, 2, 1]
+    assert app.aggregate_data(counts.sort_values("day"))["Count"].tolist() == [2, 1]
+
+
 # Add more specific tests for your application logic here